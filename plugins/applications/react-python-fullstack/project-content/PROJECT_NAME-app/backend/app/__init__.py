@@ -10,5 +10,7 @@ Dependencies: None
 
 Exports: None (package marker)
 
-Implementation: Empty __init__.py file for package structure
+Implementation: Package marker with an empty __all__ so star-imports export nothing
 """
+
+__all__: list[str] = []
@@ -3,3 +3,5 @@
 # Overview: This directory contains core business logic, utilities, and shared functionality
 #     used across the application. Examples: custom exceptions, retry logic, circuit breakers,
 #     security utilities, etc.
+
+__all__: list[str] = []
@@ -2,3 +2,5 @@
 # Scope: Helper scripts and utilities for development, testing, and operations
 # Overview: This directory contains standalone tools and scripts for tasks like
 #     database migrations, data seeding, testing utilities, etc.
+
+__all__: list[str] = []
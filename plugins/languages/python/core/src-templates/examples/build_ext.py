@@ -0,0 +1,28 @@
+"""Ahead-of-time build of the example pricing kernel.
+
+Purpose: Compile example.py's discount kernel into a native extension module
+Scope: Optional build step for the example Python module
+Overview: Uses numba.pycc to compile the discount arithmetic into an example_native extension
+    placed next to example.py. example.py imports it when present, so short-lived processes
+    skip JIT warm-up and do not need numba installed at runtime. The built extension still
+    requires NumPy at runtime.
+Dependencies: numba and a C compiler at build time; numpy at build time and runtime
+Exports: example_native extension module (discounted_price function)
+Related: example.py
+Implementation: numba.pycc CC export of the pure-Python kernel, run as a script
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from example import _discounted_price
+
+cc = CC("example_native")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+cc.export("discounted_price", "f8(f8, f8, f8)")(_discounted_price)
+
+
+if __name__ == "__main__":
+    cc.compile()
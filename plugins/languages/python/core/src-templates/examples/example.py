@@ -4,21 +4,59 @@ Purpose: Demonstrate Python coding standards and best practices
 Scope: Example code for new Python projects
 Overview: This module shows proper code style, type hints, docstrings, and structure
     following PEP 8 and ai-projen standards.
-Dependencies: None (stdlib only)
-Exports: User class, calculate_discount function
-Related: Python standards documentation
+Dependencies: None (stdlib only); an example_native extension built by build_ext.py is used
+    when present, otherwise numba and numpy are optional and enable a parallel batch kernel
+Exports: User class, calculate_discount and calculate_discount_array functions
+Related: Python standards documentation, build_ext.py
 Implementation: Example code demonstrating best practices
 """
 
+import math
+import re
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Optional
 
+try:
+    from example_native import (  # type: ignore[import-not-found, unused-ignore]
+        discounted_price as _native_discounted_price,
+    )
+except ImportError:  # pragma: no cover - built ahead of time by build_ext.py
+    _native_discounted_price = None
+
+# With the ahead-of-time build present, skip numba entirely so import pays no JIT warm-up.
+_HAS_NUMBA = False
+if _native_discounted_price is None:
+    try:
+        import numba  # type: ignore[import-not-found, unused-ignore]
+        import numpy as np  # type: ignore[import-not-found, unused-ignore]
+        import numpy.typing as npt  # type: ignore[import-not-found, unused-ignore]
+
+        _HAS_NUMBA = True
+    except ImportError:  # pragma: no cover - optional acceleration
+        pass
+
+# Compiled once at import rather than relying on re's bounded internal cache.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+\Z")
+
+# Declaration order decides which missing field is reported first.
+_REQUIRED_FIELDS = ("id", "name", "email")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
 
-@dataclass
+# Shared by the scalar and batch discount paths so their errors cannot drift apart.
+_NEGATIVE_PRICE_ERROR = "Price cannot be negative"
+_DISCOUNT_PERCENT_ERROR = "Discount percent must be between 0 and 100"
+
+# Every fastmath flag except "ninf" and "nnan": an uncapped discount is passed as +inf,
+# and NaN prices must propagate rather than become undefined behaviour.
+_FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@dataclass(slots=True, frozen=True)
 class User:
     """User data model.
 
     Represents a user in the system with basic information and status.
+    Instances are immutable and hashable, and use slots instead of a __dict__.
 
     Attributes:
         id: Unique user identifier
@@ -54,7 +92,7 @@ class User:
 def calculate_discount(
     price: float,
     discount_percent: float,
-    max_discount: Optional[float] = None,
+    max_discount: float | None = None,
 ) -> float:
     """Calculate discounted price with optional maximum limit.
 
@@ -76,23 +114,100 @@ def calculate_discount(
         70.0
     """
     if price < 0:
-        raise ValueError("Price cannot be negative")
+        raise ValueError(_NEGATIVE_PRICE_ERROR)
+
+    _validate_discount_percent(discount_percent)
+
+    return _scalar_discounted_price(price, discount_percent, _discount_cap(max_discount))
 
+
+def calculate_discount_array(
+    prices: Sequence[float],
+    discount_percent: float,
+    max_discount: float | None = None,
+) -> list[float]:
+    """Calculate discounted prices for a batch of items.
+
+    Uses a parallel numba kernel when numba is installed and example_native is
+    not built; otherwise loops in Python over the scalar kernel.
+
+    Args:
+        prices: Original prices before discount
+        discount_percent: Discount percentage (0-100) applied to every price
+        max_discount: Optional maximum discount amount per item
+
+    Returns:
+        Final prices after applying discount, in input order
+
+    Raises:
+        ValueError: If any price is negative or discount_percent is invalid
+
+    Example:
+        >>> calculate_discount_array([100.0, 50.0], 20.0)
+        [80.0, 40.0]
+    """
+    _validate_discount_percent(discount_percent)
+    cap = _discount_cap(max_discount)
+
+    if _HAS_NUMBA:
+        price_array = np.asarray(prices, dtype=np.float64)
+        if (price_array < 0).any():
+            raise ValueError(_NEGATIVE_PRICE_ERROR)
+        result: list[float] = _discounted_prices(price_array, discount_percent, cap).tolist()
+        return result
+
+    if any(price < 0 for price in prices):
+        raise ValueError(_NEGATIVE_PRICE_ERROR)
+    return [_scalar_discounted_price(price, discount_percent, cap) for price in prices]
+
+
+def _validate_discount_percent(discount_percent: float) -> None:
+    """Raise ValueError unless discount_percent lies within 0-100."""
     if not 0 <= discount_percent <= 100:
-        raise ValueError("Discount percent must be between 0 and 100")
+        raise ValueError(_DISCOUNT_PERCENT_ERROR)
+
+
+def _discount_cap(max_discount: float | None) -> float:
+    """Map an optional maximum discount onto a float the kernels accept."""
+    return math.inf if max_discount is None else float(max_discount)
 
-    discount_amount = price * (discount_percent / 100)
 
-    if max_discount is not None:
-        discount_amount = min(discount_amount, max_discount)
+def _discounted_price(price: float, discount_percent: float, max_discount: float) -> float:
+    """Apply an already validated discount; max_discount is inf when uncapped."""
+    return price - min(price * (discount_percent / 100), max_discount)
 
-    return price - discount_amount
+
+if _HAS_NUMBA:
+    # Compiled eagerly at import for the batch kernel; scalar calls skip the JIT dispatcher.
+    _jit_discounted_price = numba.njit("float64(float64, float64, float64)", cache=True, fastmath=_FASTMATH_FLAGS)(
+        _discounted_price
+    )
+
+    @numba.njit(
+        "float64[:](float64[:], float64, float64)",
+        parallel=True,
+        cache=True,
+        fastmath=_FASTMATH_FLAGS,
+    )
+    def _discounted_prices(  # type: ignore[no-any-unimported, unused-ignore]
+        prices: npt.NDArray[np.float64], discount_percent: float, max_discount: float
+    ) -> npt.NDArray[np.float64]:
+        """Apply an already validated discount to every price in parallel."""
+        result = np.empty_like(prices)
+        for i in numba.prange(prices.shape[0]):
+            result[i] = _jit_discounted_price(prices[i], discount_percent, max_discount)
+        return result
+
+
+# calculate_discount and the non-numba batch loop use the ahead-of-time build when present.
+_scalar_discounted_price = _native_discounted_price or _discounted_price
 
 
 def validate_email(email: str) -> bool:
     """Validate email format.
 
-    Simple validation checking for @ symbol and domain.
+    Simple validation requiring a single @ between a non-empty local part and a
+    dotted domain, with no whitespace.
 
     Args:
         email: Email address to validate
@@ -106,15 +221,7 @@ def validate_email(email: str) -> bool:
         >>> validate_email("invalid-email")
         False
     """
-    if not email or "@" not in email:
-        return False
-
-    parts = email.split("@")
-    if len(parts) != 2:
-        return False
-
-    local, domain = parts
-    return len(local) > 0 and "." in domain
+    return _EMAIL_RE.match(email) is not None
 
 
 def process_user_data(user_data: dict[str, str | int]) -> User:
@@ -135,11 +242,9 @@ def process_user_data(user_data: dict[str, str | int]) -> User:
         >>> user.name
         'Bob'
     """
-    required_fields = ["id", "name", "email"]
-
-    for field in required_fields:
-        if field not in user_data:
-            raise ValueError(f"Missing required field: {field}")
+    if not user_data.keys() >= _REQUIRED_FIELD_SET:
+        missing = next(field for field in _REQUIRED_FIELDS if field not in user_data)
+        raise ValueError(f"Missing required field: {missing}")
 
     email = str(user_data["email"])
     if not validate_email(email):
@@ -8,9 +8,18 @@ Related: example.py, pytest configuration
 Implementation: Pytest unit tests
 """
 
+import math
+
 import pytest
 
-from example import User, calculate_discount, process_user_data, validate_email
+import example
+from example import (
+    User,
+    calculate_discount,
+    calculate_discount_array,
+    process_user_data,
+    validate_email,
+)
 
 
 class TestUser:
@@ -31,6 +40,20 @@ class TestUser:
 
         assert user.active is True
 
+    def test_user_is_immutable(self):
+        """Test User attributes cannot be reassigned."""
+        user = User(id=1, name="Alice", email="alice@example.com")
+
+        with pytest.raises(AttributeError):
+            user.name = "Bob"  # type: ignore[misc]
+
+    def test_user_is_hashable(self):
+        """Test equal User instances hash the same and dedupe in sets."""
+        first = User(id=1, name="Alice", email="alice@example.com")
+        second = User(id=1, name="Alice", email="alice@example.com")
+
+        assert len({first, second}) == 1
+
     def test_get_display_name_returns_formatted_string(self):
         """Test get_display_name returns properly formatted string."""
         user = User(id=1, name="Alice", email="alice@example.com")
@@ -95,6 +118,71 @@ class TestCalculateDiscount:
         assert result == expected
 
 
+class TestCalculateDiscountArray:
+    """Tests for calculate_discount_array function."""
+
+    def test_calculate_discount_array_matches_scalar_results(self):
+        """Test batch results match calculate_discount for each price."""
+        prices = [100.0, 50.0, 200.0, 75.0]
+
+        result = calculate_discount_array(prices, 20.0, max_discount=30.0)
+
+        assert list(result) == [calculate_discount(p, 20.0, 30.0) for p in prices]
+
+    def test_calculate_discount_array_with_empty_input(self):
+        """Test empty input returns empty result."""
+        result = calculate_discount_array([], 20.0)
+
+        assert len(result) == 0
+
+    def test_calculate_discount_array_propagates_nan_price(self):
+        """Test a NaN price yields NaN rather than an arbitrary value."""
+        result = calculate_discount_array([float("nan")], 20.0)
+
+        assert math.isnan(result[0])
+
+    def test_calculate_discount_array_raises_error_for_negative_price(self):
+        """Test ValueError raised when any price is negative."""
+        with pytest.raises(ValueError, match="Price cannot be negative"):
+            calculate_discount_array([100.0, -10.0], 20.0)
+
+    def test_calculate_discount_array_raises_error_for_invalid_percent(self):
+        """Test ValueError raised for invalid discount percent."""
+        with pytest.raises(ValueError, match="Discount percent must be between 0 and 100"):
+            calculate_discount_array([100.0], 150.0)
+
+    @pytest.mark.parametrize(
+        "price,discount",
+        [
+            (-10.0, 20.0),
+            (100.0, -1.0),
+            (100.0, 150.0),
+        ],
+    )
+    def test_calculate_discount_array_rejects_same_inputs_as_scalar(self, price: float, discount: float):
+        """Test batch and scalar paths raise the same error for invalid inputs."""
+        with pytest.raises(ValueError) as scalar_error:
+            calculate_discount(price, discount)
+
+        with pytest.raises(ValueError) as batch_error:
+            calculate_discount_array([price], discount)
+
+        assert str(batch_error.value) == str(scalar_error.value)
+
+
+class TestNativeDiscountedPrice:
+    """Tests for the optional example_native extension built by build_ext.py."""
+
+    @pytest.mark.parametrize("max_discount", [30.0, math.inf])
+    def test_native_kernel_matches_python_kernel(self, max_discount: float):
+        """Test native output matches the Python kernel for capped and uncapped inputs."""
+        example_native = pytest.importorskip("example_native", exc_type=ImportError)
+        for price in (0.0, 19.99, 100.0, 250.0):
+            expected = example._discounted_price(price, 50.0, max_discount)
+
+            assert example_native.discounted_price(price, 50.0, max_discount) == expected
+
+
 class TestValidateEmail:
     """Tests for validate_email function."""
 
@@ -119,6 +207,9 @@ class TestValidateEmail:
             "@example.com",
             "user@",
             "user@@example.com",
+            "user name@example.com",
+            "user@.com",
+            "user@example.",
             "",
         ],
     )